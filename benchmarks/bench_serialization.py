@@ -0,0 +1,87 @@
+"""Micro-benchmark of timesheet response serialization.
+
+Compares the original path (ORM instances -> per-row as_dict() with str() on every column ->
+jsonify) with RowSerializer (plain result tuples -> typed records -> orjson/json) on a SQLite
+table of the requested sizes.  Both timings include the query.
+
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --sizes 10000 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault('FLASK_SQLALCHEMY_DATABASE_URI', 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db'))
+
+from flask import jsonify  # noqa: E402
+from sqlalchemy import delete, insert, select  # noqa: E402
+
+from app import app, db, upgrade_schema, Employee, Projects, Timesheet, serializer_for, json_response  # noqa: E402
+
+EMPLOYEES = 1000
+
+
+def seed(count):
+    db.session.execute(delete(Timesheet))
+    first = date(2000, 1, 3)
+    if db.session.get(Projects, 1) is None:
+        # timesheet rows need their employees and project (foreign keys are enforced on SQLite)
+        db.session.execute(insert(Employee), [
+            {'emp_id': i, 'first_name': 'bench', 'second_name': str(i), 'email_address': 'bench.{}@company.in'.format(i),
+             'designation': 'associate', 'project_name': 'bench', 'manager': 'bench'} for i in range(EMPLOYEES)])
+        db.session.execute(insert(Projects), [
+            {'prj_id': 1, 'prj_name': 'bench', 'prj_manager_id': 0, 'prj_location': 'bench',
+             'prj_start_date': first, 'prj_end_date': first + timedelta(days=3650)}])
+    rows = ({'emp_id': i % EMPLOYEES, 'work_date': first + timedelta(days=i // EMPLOYEES), 'hours': 8, 'shift': 1,
+             'prj_id': 1} for i in range(count))
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == 50000:
+            db.session.execute(insert(Timesheet), batch)
+            batch = []
+    if batch:
+        db.session.execute(insert(Timesheet), batch)
+    db.session.commit()
+
+
+def legacy():
+    columns = Timesheet.__table__.columns
+    service = db.session.query(Timesheet).all()
+    body = jsonify([{c.name: str(getattr(row, c.name)) for c in columns} for row in service]).get_data()
+    db.session.expunge_all()
+    return body
+
+
+def serializer():
+    rows = db.session.execute(select(*Timesheet.__table__.columns)).all()
+    return json_response(serializer_for(Timesheet).records(rows)).get_data()
+
+
+def timed(func):
+    started = time.perf_counter()
+    body = func()
+    return time.perf_counter() - started, len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 1000000])
+    args = parser.parse_args()
+    app.config['SLOW_QUERY_MS'] = float('inf')
+    with app.test_request_context():
+        upgrade_schema()
+        print("{:>9} {:>10} {:>12} {:>8} {:>12} {:>12}".format('rows', 'legacy s', 'serializer s', 'speedup',
+                                                            'legacy MB', 'new MB'))
+        for size in args.sizes:
+            seed(size)
+            legacy_s, legacy_bytes = timed(legacy)
+            new_s, new_bytes = timed(serializer)
+            print("{:>9} {:>10.3f} {:>12.3f} {:>7.1f}x {:>12.1f} {:>12.1f}".format(
+                size, legacy_s, new_s, legacy_s / new_s, legacy_bytes / 1e6, new_bytes / 1e6))
+
+
+if __name__ == '__main__':
+    main()
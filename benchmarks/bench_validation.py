@@ -0,0 +1,67 @@
+"""Benchmark for Timesheet.validate_batch against the per-week is_workday/check_hours checks.
+
+Generates clean synthetic rows (so both paths do their full work) and times each path at
+increasing batch sizes.  Project ranges are passed in; closed periods and the calendar are read
+from an empty temporary SQLite database, so workdays fall back to the weekday rule.
+
+    python -m benchmarks.bench_validation
+    python -m benchmarks.bench_validation --sizes 10000 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault('FLASK_SQLALCHEMY_DATABASE_URI', 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db'))
+
+from app import app, upgrade_schema, Timesheet  # noqa: E402
+
+PROJECTS = 50
+FIRST_MONDAY = date(2020, 1, 6)
+
+
+def generate_rows(count):
+    # one row per employee and workday, employees fill consecutive weeks
+    rows = []
+    workdays = [FIRST_MONDAY + timedelta(weeks=w, days=d) for w in range(52) for d in range(5)]
+    emp_id = 0
+    while len(rows) < count:
+        emp_id += 1
+        rows.extend({'emp_id': emp_id, 'work_date': str(day), 'hours': 8, 'shift': 1, 'prj_id': emp_id % PROJECTS}
+                    for day in workdays[:count - len(rows)])
+    return rows
+
+
+def legacy_validate(rows):
+    # what timesheet_add did per submitted week before the batch engine
+    for start in range(0, len(rows), 5):
+        week = rows[start:start + 5]
+        Timesheet.is_workday([row['work_date'] for row in week])
+        Timesheet.check_hours(week)
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    args = parser.parse_args()
+    projects = {prj_id: (FIRST_MONDAY, FIRST_MONDAY + timedelta(days=400)) for prj_id in range(PROJECTS)}
+
+    print("{:>9} {:>12} {:>12} {:>14}".format('rows', 'batch s', 'legacy s', 'batch rows/s'))
+    with app.app_context():
+        upgrade_schema()
+        for size in args.sizes:
+            rows = generate_rows(size)
+            batch = timed(Timesheet.validate_batch, rows, projects)
+            legacy = timed(legacy_validate, rows)
+            print("{:>9} {:>12.3f} {:>12.3f} {:>14,.0f}".format(size, batch, legacy, size / batch))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""Load test for the timesheet endpoints.
+
+Runs each scenario with a pool of client threads and reports requests per second and
+p50/p99 latency.  Without --url the app is driven in-process through the Flask test client
+against a SQLite stand-in; with --url it talks HTTP to a running server (e.g. gunicorn on
+Postgres) and seeds its data through the API.
+
+    python -m benchmarks.loadtest
+    python -m benchmarks.loadtest --url http://localhost:8000 --concurrency 32 --requests 5000
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+SEED_BASE = 900000
+FIRST_MONDAY = date(2021, 1, 4)
+
+
+class HttpClient:
+
+    def __init__(self, url):
+        self.url = url.rstrip('/')
+
+    def request(self, method, path, body):
+        req = urllib.request.Request(self.url + path, data=json.dumps(body).encode(), method=method,
+                                     headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(req) as response:
+            return response.status, response.read()
+
+
+class InProcessClient:
+
+    def __init__(self, app):
+        self.app = app
+        self.local = threading.local()
+
+    def request(self, method, path, body):
+        if not hasattr(self.local, 'client'):
+            self.local.client = self.app.test_client()
+        response = self.local.client.open(path, method=method, json=body)
+        return response.status_code, response.get_data()
+
+
+def week(monday, prj_id, hours=4):
+    return [{'work_date': str(monday + timedelta(days=d)), 'hours': hours, 'shift': 1, 'prj_id': prj_id}
+            for d in range(5)]
+
+
+def seed(client, employees, weeks):
+    for i in range(employees):
+        client.request('POST', '/employee_add', {
+            'emp_id': SEED_BASE + i, 'first_name': 'load', 'second_name': str(i), 'designation': 'associate',
+            'project_name': 'load', 'manager': 'load'})
+    client.request('POST', '/projects_add', {
+        'prj_id': SEED_BASE, 'prj_name': 'load', 'prj_location': 'load', 'prj_start_date': str(FIRST_MONDAY),
+        'prj_end_date': str(FIRST_MONDAY + timedelta(weeks=520)), 'prj_manager_id': SEED_BASE})
+    for w in range(weeks):
+        client.request('POST', '/timesheet_bulk_add', {'timesheets': [
+            {'emp_id': SEED_BASE + i, 'weekly_details': week(FIRST_MONDAY + timedelta(weeks=w), SEED_BASE)}
+            for i in range(employees)]})
+
+
+def says(text):
+    # rejections and failures answer 200 with a message, so success is read from the body
+    return lambda body: text in body.lower()
+
+
+def returns_json(body):
+    return body[:1] in (b'{', b'[')
+
+
+def scenarios(employees, weeks):
+    # each timesheet_add call gets its own (employee, future week) so inserts never conflict
+    fresh_weeks = itertools.count()
+
+    def emp():
+        return SEED_BASE + random.randrange(employees)
+
+    def add():
+        n = next(fresh_weeks)
+        monday = FIRST_MONDAY + timedelta(weeks=weeks + n // employees)
+        return 'POST', '/timesheet_add', {'emp_id': SEED_BASE + n % employees,
+                                          'weekly_details': week(monday, SEED_BASE)}
+
+    def update():
+        monday = FIRST_MONDAY + timedelta(weeks=random.randrange(weeks))
+        return 'POST', '/timesheet_update', {'emp_id': emp(), 'weekly_details': [
+            {'work_date': str(monday), 'hours': 0}]}
+
+    # name -> (request factory, check of a successful response body)
+    return {
+        'timesheet_get': (lambda: ('GET', '/timesheet_get', {'emp_id': emp()}), returns_json),
+        'timesheet_get_page': (lambda: ('GET', '/timesheet_get', {'emp_id': emp(), 'limit': 20}), returns_json),
+        'timesheet_add': (add, says(b'added successfully')),
+        'timesheet_update': (update, says(b'updated successfully')),
+        'employee_get': (lambda: ('GET', '/employee_get', {'emp_id': emp()}), returns_json),
+    }
+
+
+def percentile(ordered, q):
+    return ordered[int(round(q * (len(ordered) - 1)))]
+
+
+def run(client, make_request, expect, requests, concurrency):
+    latencies, errors = [], 0
+
+    def one(_):
+        method, path, body = make_request()
+        started = time.perf_counter()
+        try:
+            status, content = client.request(method, path, body)
+        except Exception:
+            status, content = 599, b''
+        return time.perf_counter() - started, status >= 400 or not expect(content)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        for latency, failed in pool.map(one, range(requests)):
+            latencies.append(latency)
+            errors += failed
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {'requests': requests, 'errors': errors, 'rps': requests / elapsed,
+            'p50_ms': percentile(latencies, 0.50) * 1000, 'p99_ms': percentile(latencies, 0.99) * 1000,
+            'mean_ms': statistics.fmean(latencies) * 1000}
+
+
+def in_process_client():
+    path = os.path.join(tempfile.mkdtemp(), 'loadtest.db')
+    os.environ.setdefault('FLASK_SQLALCHEMY_DATABASE_URI', 'sqlite:///' + path)
+    from app import app, upgrade_schema
+    with app.app_context():
+        upgrade_schema()
+    return InProcessClient(app)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help='base URL of a running server; in-process SQLite when omitted')
+    parser.add_argument('--employees', type=int, default=200)
+    parser.add_argument('--weeks', type=int, default=12)
+    parser.add_argument('--requests', type=int, default=1000, help='requests per scenario')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--scenario', action='append', help='run only these scenarios')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+
+    client = HttpClient(args.url) if args.url else in_process_client()
+    seed(client, args.employees, args.weeks)
+    results = {}
+    print("{:<20} {:>8} {:>7} {:>9} {:>9} {:>9}".format('scenario', 'requests', 'errors', 'req/s', 'p50 ms', 'p99 ms'))
+    for name, (make_request, expect) in scenarios(args.employees, args.weeks).items():
+        if args.scenario and name not in args.scenario:
+            continue
+        results[name] = result = run(client, make_request, expect, args.requests, args.concurrency)
+        print("{:<20} {requests:>8} {errors:>7} {rps:>9.1f} {p50_ms:>9.2f} {p99_ms:>9.2f}".format(name, **result))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+import os
+import tempfile
+from datetime import date
+
+import pytest
+
+DATABASE = os.path.join(tempfile.mkdtemp(), 'test.db')
+os.environ['FLASK_SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + DATABASE
+from app import app, db, upgrade_schema, build_calendar  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    # a new database file per test, the change_log triggers outlive a drop_all
+    with app.app_context():
+        upgrade_schema()
+        yield app.test_client()
+        db.session.remove()
+        db.engine.dispose()
+    os.remove(DATABASE)
+
+
+@pytest.fixture
+def project(client):
+    # employee 1 on project 1, which runs through 2024 with the calendar built
+    client.post('/employee_add', json={'emp_id': 1, 'first_name': 'first', 'second_name': '1', 'designation': 'associate',
+                                       'project_name': 'p', 'manager': 'm'})
+    client.post('/projects_add', json={'prj_id': 1, 'prj_name': 'p', 'prj_location': 'chennai', 'prj_manager_id': 1,
+                                       'prj_start_date': '2024-01-01', 'prj_end_date': '2024-12-31'})
+    build_calendar(date(2024, 1, 1), date(2024, 12, 31))
+    return client
@@ -0,0 +1,116 @@
+"""Timesheet ETags (sync and async) and /changes cursor paging, on a temporary SQLite database.
+
+    python -m pytest tests
+"""
+import asyncio
+import json
+
+from sqlalchemy import select, text
+
+from app import db, async_timesheet_get, dispose_async_engine, ChangeLog, Timesheet
+
+
+def add_entry(client, work_date, hours=8):
+    response = client.post('/timesheet_add', json={'emp_id': 1, 'weekly_details': [
+        {'work_date': work_date, 'hours': hours, 'shift': 1, 'prj_id': 1}]})
+    assert b'added successfully' in response.data
+
+
+def get_page(client, etag=None, **body):
+    headers = {'If-None-Match': '"{}"'.format(etag)} if etag else {}
+    return client.get('/timesheet_get', json=dict(body, emp_id=1), headers=headers)
+
+
+def dates(response):
+    return [entry['work_date'] for entry in response.get_json()['entries']]
+
+
+def async_get(body, etag=None):
+    # the ASGI app passes the raw body and query string as the request key, like the sync route
+    async def get():
+        try:
+            return await async_timesheet_get(body, {etag} if etag else set(), json.dumps(body).encode())
+        finally:
+            await dispose_async_engine()
+    return asyncio.run(get())
+
+
+def test_unchanged_page_is_not_modified(project):
+    add_entry(project, '2024-03-04')
+    first = get_page(project, limit=2)
+    again = get_page(project, first.get_etag()[0], limit=2)
+    assert again.status_code == 304 and again.get_etag() == first.get_etag()
+
+
+def test_page_etag_follows_rows_shifting_into_the_page(project):
+    add_entry(project, '2024-03-05')
+    add_entry(project, '2024-03-06')
+    add_entry(project, '2024-03-04')
+    first = get_page(project, limit=2)
+    assert dates(first) == ['2024-03-04', '2024-03-05']
+
+    # count, max s_no and sum of versions are unchanged, the page is not
+    project.delete('/timesheet_delete', json={'emp_id': 1, 'dates': ['2024-03-05']})
+    second = get_page(project, first.get_etag()[0], limit=2)
+    assert second.status_code == 200 and dates(second) == ['2024-03-04', '2024-03-06']
+    assert second.get_etag() != first.get_etag()
+
+
+def test_update_changes_etag(project):
+    add_entry(project, '2024-03-04', hours=4)
+    first = get_page(project)
+    response = project.post('/timesheet_update', json={'emp_id': 1, 'weekly_details': [
+        {'work_date': '2024-03-04', 'hours': 2, 'prj_id': 1}]})
+    assert b'updated successfully' in response.data
+    assert get_page(project, first.get_etag()[0]).status_code == 200
+
+
+def test_async_etag_matches_sync(project):
+    add_entry(project, '2024-03-05')
+    add_entry(project, '2024-03-06')
+    add_entry(project, '2024-03-04')
+    body = {'emp_id': 1, 'limit': 2}
+    status, payload, etag = async_get(body)
+    sync = project.get('/timesheet_get', data=json.dumps(body), content_type='application/json')
+    assert status == 200 and sync.get_etag()[0] == etag
+    assert async_get(body, etag)[0] == 304
+    project.delete('/timesheet_delete', json={'emp_id': 1, 'dates': ['2024-03-05']})
+    status, payload, changed = async_get(body, etag)
+    assert status == 200 and changed != etag
+    assert [str(entry['work_date']) for entry in payload['entries']] == ['2024-03-04', '2024-03-06']
+
+
+def test_rows_written_outside_sqlalchemy_get_updated_at(project):
+    # as COPY loads do
+    db.session.execute(text("INSERT INTO timesheet (emp_id, work_date, hours, shift, prj_id) "
+                            "VALUES (1, '2024-03-04', 8, 1, 1)"))
+    assert db.session.scalar(select(Timesheet.updated_at)) is not None
+
+
+def page_through(client, since='', **params):
+    seqs = []
+    while True:
+        body = client.get('/changes', query_string=dict(params, since=since, limit=2)).get_json()
+        seqs.extend(change['seq'] for change in body['changes'])
+        since = body['next']
+        if not body['more']:
+            return seqs, since
+
+
+def test_changes_paging(project):
+    add_entry(project, '2024-03-04')
+    add_entry(project, '2024-03-05')
+    every = list(db.session.scalars(select(ChangeLog.seq).order_by(ChangeLog.seq)))
+    seqs, cursor = page_through(project)
+    assert seqs == every and len(every) > 2
+
+    # a caught-up cursor returns nothing until the next write, then only that write
+    assert page_through(project, cursor)[0] == []
+    add_entry(project, '2024-03-06')
+    new, _ = page_through(project, cursor)
+    assert len(new) == 1 and new[0] > every[-1]
+    assert page_through(project, tables='holiday')[0] == []
+
+
+def test_changes_invalid_cursor(client):
+    assert client.get('/changes', query_string={'since': 'x'}).data == b'Invalid cursor x'
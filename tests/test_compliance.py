@@ -0,0 +1,30 @@
+"""Timesheet compliance over the calendar, on a temporary SQLite database.
+
+    python -m pytest tests
+"""
+
+
+def add(client, work_date, hours):
+    response = client.post('/timesheet_add', json={'emp_id': 1, 'weekly_details': [
+        {'work_date': work_date, 'hours': hours, 'shift': 1, 'prj_id': 1}]})
+    assert b'added successfully' in response.data
+
+
+def compliance(client, **body):
+    return client.get('/timesheet_compliance', json=dict({'from': '2024-03-04', 'to': '2024-03-10'}, **body)).get_json()
+
+
+def test_missing_and_under_filled_days(project):
+    add(project, '2024-03-04', 0)
+    add(project, '2024-03-05', 4)
+    add(project, '2024-03-06', 8)
+    project.post('/holiday_add', json={'location': 'chennai', 'date': '2024-03-08', 'name': 'local'})
+    report = compliance(project)
+    assert report['employees'] == [{'emp_id': 1, 'missing': ['2024-03-07'], 'under_filled': [
+        {'work_date': '2024-03-04', 'hours': 0}, {'work_date': '2024-03-05', 'hours': 4}]}]
+
+
+def test_min_hours(project):
+    for day in ('2024-03-04', '2024-03-05', '2024-03-06', '2024-03-07', '2024-03-08'):
+        add(project, day, 4)
+    assert compliance(project, min_hours=4)['employees'] == []
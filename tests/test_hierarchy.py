@@ -0,0 +1,72 @@
+"""Org hierarchy closure table, on a temporary SQLite database.
+
+    python -m pytest tests
+"""
+from sqlalchemy import select
+
+from app import db, EmployeeHierarchy
+
+
+def add_employee(client, emp_id, manager_id=None):
+    response = client.post('/employee_add', json={
+        'emp_id': emp_id, 'first_name': 'first', 'second_name': str(emp_id), 'designation': 'associate',
+        'project_name': 'p', 'manager': 'm', 'manager_id': manager_id})
+    assert b'added successfully' in response.data
+    return response
+
+
+def move_employee(client, emp_id, manager_id):
+    return client.post('/employee_update', json={
+        'emp_id': emp_id, 'first_name': 'first', 'second_name': str(emp_id),
+        'email_address': 'first.{}@company.in'.format(emp_id), 'designation': 'associate',
+        'project_name': 'p', 'manager': 'm', 'manager_id': manager_id})
+
+
+def closure():
+    table = EmployeeHierarchy.__table__
+    return {tuple(row) for row in db.session.execute(select(table.c.ancestor_id, table.c.descendant_id, table.c.depth))}
+
+
+def assert_matches_rebuild():
+    # the incrementally maintained rows must be exactly what a rebuild from manager_id produces
+    maintained = closure()
+    EmployeeHierarchy.rebuild()
+    rebuilt = closure()
+    db.session.rollback()
+    assert maintained == rebuilt
+    return maintained
+
+
+def chain(client):
+    # 1 <- 2 <- 3, and 4 on its own
+    add_employee(client, 1)
+    add_employee(client, 2, 1)
+    add_employee(client, 3, 2)
+    add_employee(client, 4)
+
+
+def test_add(client):
+    chain(client)
+    rows = assert_matches_rebuild()
+    assert (1, 3, 2) in rows and (4, 4, 0) in rows
+
+
+def test_move(client):
+    chain(client)
+    assert b'updated successfully' in move_employee(client, 2, 4).data
+    rows = assert_matches_rebuild()
+    assert (4, 3, 2) in rows and (1, 3, 2) not in rows
+
+
+def test_rejected_cycle(client):
+    chain(client)
+    before = closure()
+    assert b'in their own team' in move_employee(client, 1, 3).data
+    assert assert_matches_rebuild() == before
+
+
+def test_delete(client):
+    chain(client)
+    assert b'deleted successfully' in client.delete('/employee_delete', json={'emp_id': 2}).data
+    rows = assert_matches_rebuild()
+    assert (1, 3, 1) in rows and not any(2 in row[:2] for row in rows)
@@ -0,0 +1,115 @@
+"""Timesheet writes through the routes, on a temporary SQLite database.
+
+    python -m pytest tests
+"""
+from sqlalchemy import select
+
+from app import db, Timesheet
+
+
+def week(*days, hours=4, prj_id=1):
+    return [{'work_date': day, 'hours': hours, 'shift': 1, 'prj_id': prj_id} for day in days]
+
+
+def add(client, weekly_details, **body):
+    return client.post('/timesheet_add', json=dict(body, emp_id=1, weekly_details=weekly_details))
+
+
+def update(client, weekly_details, **body):
+    return client.post('/timesheet_update', json=dict(body, emp_id=1, weekly_details=weekly_details))
+
+
+def errors(response):
+    return [(violation['row'], violation['error']) for violation in response.get_json()['errors']]
+
+
+def hours():
+    return {str(row.work_date): row.hours for row in db.session.execute(select(Timesheet.work_date, Timesheet.hours))}
+
+
+def test_add_reports_every_violation(project):
+    response = add(project, week('2024-03-04', '2024-03-09') + week('2024-03-05', hours=9) +
+                   week('2024-03-06', prj_id=7) + week('2024-03-07', '2024-03-07'))
+    assert errors(response) == [
+        (1, "2024-03-09 is not a workday. Please check your entry."),
+        (2, "Work hours cant be more than 8 hours per day. Recheck your entry for date 2024-03-05"),
+        (3, "Project id 7 does not exist"),
+        (5, "Only one entry per day is allowed. Recheck your entry for date 2024-03-07"),
+    ]
+    assert hours() == {}
+
+
+def test_add_rejects_existing_entries(project):
+    add(project, week('2024-03-04'))
+    assert errors(add(project, week('2024-03-04', '2024-03-05'))) == [(0, "Entry already exists")]
+    assert hours() == {'2024-03-04': 4}
+
+
+def test_update_takes_work_date_and_hours(project):
+    add(project, week('2024-03-04'))
+    response = update(project, [{'work_date': '2024-03-04', 'hours': 2}])
+    assert b'updated successfully' in response.data
+    assert hours() == {'2024-03-04': 6}
+
+
+def test_update_of_a_missing_entry(project):
+    assert errors(update(project, [{'work_date': '2024-03-04', 'hours': 2}])) == [(0, "Entry Doesn't Exist")]
+
+
+def test_update_checks_the_stored_project(project):
+    project.post('/projects_add', json={'prj_id': 2, 'prj_name': 'q', 'prj_location': 'pune', 'prj_manager_id': 1,
+                                        'prj_start_date': '2024-01-01', 'prj_end_date': '2024-12-31'})
+    add(project, week('2024-03-04', prj_id=2))
+    project.post('/holiday_add', json={'location': 'pune', 'date': '2024-03-04', 'name': 'local'})
+    response = update(project, week('2024-03-04', hours=1, prj_id=1))
+    assert errors(response) == [(0, "2024-03-04 is not a workday. Please check your entry.")]
+    assert hours() == {'2024-03-04': 4}
+
+
+def test_update_cap(project):
+    add(project, week('2024-03-04', hours=6))
+    response = update(project, [{'work_date': '2024-03-04', 'hours': 3}])
+    assert response.data == b"Work hours cant be more than 8 hours per day. Recheck your entry for date 2024-03-04"
+    assert hours() == {'2024-03-04': 6}
+
+
+def test_upsert_adds_hours_up_to_the_cap(project):
+    add(project, week('2024-03-04', hours=6))
+    assert b'added successfully' in add(project, week('2024-03-04', '2024-03-05', hours=2), upsert=True).data
+    assert hours() == {'2024-03-04': 8, '2024-03-05': 2}
+
+
+def test_upsert_over_the_cap_changes_nothing(project):
+    add(project, week('2024-03-04', hours=6))
+    response = add(project, week('2024-03-05', hours=2) + week('2024-03-04', hours=3), upsert=True)
+    assert response.data == b"Work hours cant be more than 8 hours per day. Recheck your entry for date 2024-03-04"
+    assert hours() == {'2024-03-04': 6}
+    response = update(project, week('2024-03-04', hours=3), upsert=True)
+    assert b'more than 8 hours' in response.data
+    assert hours() == {'2024-03-04': 6}
+
+
+def delete(client, **body):
+    return client.delete('/timesheet_delete', json=dict(body, emp_id=1))
+
+
+def test_delete_listed_dates_is_all_or_nothing(project):
+    add(project, week('2024-03-04', '2024-03-05'))
+    assert delete(project, dates=['2024-03-04', '2024-03-06']).data == b"No such entries"
+    assert hours() == {'2024-03-04': 4, '2024-03-05': 4}
+    assert b'deleted successfully' in delete(project, dates=['2024-03-04', '2024-03-05']).data
+    assert hours() == {}
+
+
+def test_delete_range(project):
+    add(project, week('2024-03-04', '2024-03-05', '2024-03-06'))
+    assert b'deleted successfully' in delete(project, **{'from': '2024-03-05'}).data
+    assert hours() == {'2024-03-04': 4}
+
+
+def test_delete_needs_valid_dates(project):
+    add(project, week('2024-03-04'))
+    assert delete(project, dates=['bad']).data == b"Please provide dates as YYYY-MM-DD"
+    assert delete(project, to='2024-13-01').data == b"Please provide dates as YYYY-MM-DD"
+    assert delete(project).data == b"Please provide the dates to delete, or a from and/or to date"
+    assert hours() == {'2024-03-04': 4}
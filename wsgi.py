@@ -0,0 +1,21 @@
+# Production entry point for a multi-worker WSGI server, e.g.
+#   gunicorn --preload --workers 4 --bind 0.0.0.0:8000 wsgi:app
+# or an ASGI server, which also serves the /async/ read endpoints on the event loop with a pooled
+# async engine per worker (needs asgiref and asyncpg); every other route runs in the server's
+# thread pool through WsgiToAsgi,
+#   uvicorn --workers 4 wsgi:asgi_app
+# Database URI and pool settings come from FLASK_* environment variables, see app.py.
+from app import app, db, create_rotating_log, upgrade_schema, AsyncReads
+
+create_rotating_log()
+with app.app_context():
+    upgrade_schema()
+    # connections opened while migrating must not be shared with forked workers
+    db.engine.dispose()
+
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    asgi_app = AsyncReads(WsgiToAsgi(app))
+except ImportError:
+    asgi_app = None